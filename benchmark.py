@@ -0,0 +1,83 @@
+# Timings for CLI startup and rendering, run with: python benchmark.py
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLE_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="400" height="150">
+<path d="M10 80 C 40 10, 65 10, 95 80 S 150 150, 180 80 Q 200 30 220 80 L 250 100"/>
+<path d="M20 130 L 120 130 L 130 120"/>
+<path d="M260 120 A 30 30 0 0 1 380 120"/>
+</svg>
+"""
+
+
+def time_command(args, runs=5):
+    # Best of several runs, each in a fresh interpreter
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_render(svg_file, use_rainbow_mode, runs=3):
+    from svg_to_gif import create_animation, extract_paths_data, parse_svg_paths
+
+    paths_data, width, height = extract_paths_data(svg_file)
+    paths = parse_svg_paths(paths_data)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        create_animation(
+            paths,
+            width,
+            height,
+            2,
+            30,
+            (0, 0, 0, 255),
+            2,
+            True,
+            0,
+            0.05,
+            False,
+            use_rainbow_mode,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    with tempfile.NamedTemporaryFile("w", suffix=".svg", delete=False) as f:
+        f.write(SAMPLE_SVG)
+        svg_file = f.name
+
+    try:
+        python = sys.executable
+        baseline = time_command([python, "-c", "pass"])
+        results = {
+            "interpreter startup": baseline,
+            "import svg_to_gif": time_command([python, "-c", "import svg_to_gif"]),
+            "svg_to_gif.py --version": time_command(
+                [python, "svg_to_gif.py", "--version"]
+            ),
+            "svg_to_gif.py --validate": time_command(
+                [python, "svg_to_gif.py", "--validate", svg_file]
+            ),
+            "render (solid)": time_render(svg_file, False),
+            "render (rainbow)": time_render(svg_file, True),
+        }
+    finally:
+        os.remove(svg_file)
+
+    for name, seconds in results.items():
+        print(f"{name:<28} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
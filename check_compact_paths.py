@@ -0,0 +1,121 @@
+# Checks for the compact geometry format, run with: python check_compact_paths.py
+
+import os
+import tempfile
+
+import numpy as np
+
+from svg_to_gif import (
+    compact_paths,
+    create_animation,
+    draw_path,
+    load_compact_paths,
+    parse_svg_paths,
+    save_compact_paths,
+)
+
+ARC_PATHS = [
+    "M260 120 A 30 30 0 0 1 380 120",
+    "M100 100 A 50 50 0 1 1 100.1 100",
+]
+
+SAMPLE_PATHS = [
+    "M10 80 C 40 10, 65 10, 95 80 S 150 150, 180 80 Q 200 30 220 80 L 250 100",
+    "M20 130 L 120 130 L 130 120",
+    "M260 120 A 30 30 0 0 1 380 120",
+]
+
+
+class RecordingDraw:
+    # Stands in for ImageDraw.Draw and keeps the endpoints of every line
+    def __init__(self):
+        self.points = []
+
+    def line(self, xy, **kwargs):
+        self.points.extend(xy)
+
+
+def check_arc_loopback(d):
+    # A loopback render must stop once, at 40% of the arc
+    arc = parse_svg_paths([d])[0][0]
+    draw = RecordingDraw()
+    draw_path(
+        draw,
+        compact_paths([[arc]]),
+        1,
+        0,
+        0,
+        (0, 0, 0, 255),
+        2,
+        False,
+        0,
+        1,
+        True,
+        False,
+        0,
+        1,
+    )
+
+    expected_end = arc.point(0.4)
+    tolerance = 0.01 * abs(arc.radius)
+    x, y = draw.points[-1]
+    error = abs(complex(x, y) - expected_end)
+    assert error < tolerance, f"{d}: loopback ends {error:.2f} off"
+
+    reach = max(abs(complex(x, y) - arc.start) for x, y in draw.points)
+    limit = abs(expected_end - arc.start) + tolerance
+    assert reach <= limit, f"{d}: drawn past the loopback cut"
+
+
+def check_round_trip(directory, dtype):
+    geometry = compact_paths(parse_svg_paths(SAMPLE_PATHS), dtype)
+    assert geometry.dtype == np.dtype(dtype)
+
+    filename = os.path.join(directory, f"round_trip_{dtype}.npy")
+    save_compact_paths(filename, geometry)
+    loaded = load_compact_paths(filename, mmap=False)
+    assert loaded.dtype == geometry.dtype, f"{dtype}: saved as {loaded.dtype}"
+    assert np.array_equal(loaded, geometry), f"{dtype}: round trip changed data"
+
+
+def check_memmap_is_read_only(directory):
+    filename = os.path.join(directory, "memmap.npy")
+    save_compact_paths(filename, compact_paths(parse_svg_paths(SAMPLE_PATHS)))
+    geometry = load_compact_paths(filename)
+    assert isinstance(geometry, np.memmap), "load did not memory-map the file"
+    assert not geometry.flags.writeable, "memory-mapped geometry is writable"
+
+
+def check_memmap_render(directory):
+    # Rendering from a loaded file must match rendering the parsed paths
+    paths = parse_svg_paths(SAMPLE_PATHS)
+    filename = os.path.join(directory, "render.npy")
+    save_compact_paths(filename, compact_paths(paths))
+    geometry = load_compact_paths(filename)
+
+    for use_rainbow_mode in (False, True):
+        for is_loopback in (False, True):
+            args = (400, 150, 0.5, 10, (0, 0, 0, 255), 2, True, 0, 0.05)
+            modes = (is_loopback, use_rainbow_mode)
+            expected = create_animation(paths, *args, *modes)
+            actual = create_animation(geometry, *args, *modes)
+            for a, b in zip(expected, actual):
+                same = np.array_equal(np.asarray(a), np.asarray(b))
+                assert same, f"memmap render differs for (loopback, rainbow) {modes}"
+
+
+def main():
+    for d in ARC_PATHS:
+        check_arc_loopback(d)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for dtype in ("float32", "float64"):
+            check_round_trip(directory, dtype)
+        check_memmap_is_read_only(directory)
+        check_memmap_render(directory)
+
+    print("compact geometry checks passed")
+
+
+if __name__ == "__main__":
+    main()
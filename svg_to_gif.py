@@ -1,8 +1,15 @@
-import xml.etree.ElementTree as ET
-from svgpathtools import parse_path
-from PIL import Image, ImageDraw
-import numpy as np
+# Heavy dependencies (svgpathtools, Pillow, numpy) are imported inside the
+# functions that use them, so prompts, --version and --validate start quickly.
+import argparse
 import colorsys
+import functools
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+# Placeholder until the project tags releases; only reported by --version
+__version__ = "1.0.0"
 
 
 def extract_paths_data(svg_file):
@@ -23,10 +30,202 @@ def extract_paths_data(svg_file):
     return [path.get("d") for path in paths], width, height
 
 
+# Arguments per repetition of each path command, for a cheap syntax check that
+# doesn't need svgpathtools
+PATH_COMMAND_ARGS = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+PATH_COMMAND = re.compile(r"[\s,]*([MmZzLlHhVvCcSsQqTtAa])")
+PATH_NUMBER = re.compile(r"[\s,]*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+# Arc flags are single characters and may be written without separators,
+# e.g. "0 011 1" is the flags 0 and 1 followed by 1 1
+PATH_FLAG = re.compile(r"[\s,]*([01])")
+
+
+def check_path_data(d):
+    d = d.rstrip(" \t\r\n,")
+    commands = []
+    pos = 0
+    while pos < len(d):
+        match = PATH_COMMAND.match(d, pos)
+        if match:
+            commands.append([match.group(1), 0])
+            pos = match.end()
+            continue
+
+        if not commands:
+            return "path data must start with a moveto command"
+        command, count = commands[-1]
+        if command in ("A", "a") and count % 7 in (3, 4):
+            match = PATH_FLAG.match(d, pos)
+        else:
+            match = PATH_NUMBER.match(d, pos)
+        if not match:
+            unexpected = d[pos:].lstrip(" \t\r\n,")[:10]
+            return f"unexpected {unexpected!r} in path data"
+        commands[-1][1] += 1
+        pos = match.end()
+
+    if not commands or commands[0][0] not in ("M", "m"):
+        return "path data must start with a moveto command"
+
+    for command, count in commands:
+        arity = PATH_COMMAND_ARGS[command.upper()]
+        if arity == 0:
+            valid = count == 0
+        else:
+            valid = count > 0 and count % arity == 0
+        if not valid:
+            return f"wrong number of arguments for {command!r}"
+    return None
+
+
+def validate_svg(svg_file):
+    try:
+        paths_data, width, height = extract_paths_data(svg_file)
+    except (ET.ParseError, ValueError, OSError) as e:
+        return None, None, None, [f"could not read SVG: {e}"]
+
+    errors = []
+    if width is None or height is None:
+        errors.append("no width/height or viewBox")
+    elif width <= 0 or height <= 0:
+        errors.append(f"invalid dimensions {width}x{height}")
+    if not paths_data:
+        errors.append("no <path> elements")
+    for i, d in enumerate(paths_data, 1):
+        if not d or not d.strip():
+            errors.append(f"path {i}: no path data")
+            continue
+        error = check_path_data(d)
+        if error:
+            errors.append(f"path {i}: {error}")
+    return len(paths_data), width, height, errors
+
+
 def parse_svg_paths(path_data_list):
+    from svgpathtools import parse_path
+
     return [parse_path(d) for d in path_data_list]
 
 
+# Compact geometry: one row per segment. Lines and quadratics are stored as
+# exactly degree-elevated cubic Beziers; arcs keep their exact parameters.
+# Columns: 8 geometry values, segment type code, path index, cumulative length
+# within the path, and the segment bbox (xmin, xmax, ymin, ymax).
+# The geometry values are 4 control points as x/y pairs for Bezier segments,
+# and center x/y, radius x/y, rotation, start angle and sweep (in degrees)
+# for arcs.
+SEGMENT_LINE = 1
+SEGMENT_QUADRATIC = 2
+SEGMENT_CUBIC = 3
+SEGMENT_ARC = 4
+
+CONTROL_POINTS = slice(0, 8)
+SEGMENT_KIND = 8
+PATH_INDEX = 9
+CUMULATIVE_LENGTH = 10
+BBOX = slice(11, 15)
+COMPACT_COLUMNS = 15
+
+
+def segment_to_row(segment):
+    from svgpathtools import Arc, CubicBezier, Line, QuadraticBezier
+
+    if isinstance(segment, Line):
+        p0, p3 = segment.start, segment.end
+        points = [p0, p0 + (p3 - p0) / 3, p0 + 2 * (p3 - p0) / 3, p3]
+        kind = SEGMENT_LINE
+    elif isinstance(segment, QuadraticBezier):
+        p0, q, p3 = segment.start, segment.control, segment.end
+        points = [p0, p0 + 2 * (q - p0) / 3, p3 + 2 * (q - p3) / 3, p3]
+        kind = SEGMENT_QUADRATIC
+    elif isinstance(segment, CubicBezier):
+        points = list(segment.bpoints())
+        kind = SEGMENT_CUBIC
+    elif isinstance(segment, Arc):
+        return [
+            segment.center.real,
+            segment.center.imag,
+            segment.radius.real,
+            segment.radius.imag,
+            segment.rotation,
+            segment.theta,
+            segment.delta,
+            0.0,
+        ], SEGMENT_ARC
+    else:
+        raise ValueError(f"Unsupported segment type: {type(segment).__name__}")
+
+    row = []
+    for p in points:
+        row.extend((p.real, p.imag))
+    return row, kind
+
+
+def compact_paths(paths, dtype="float64"):
+    import numpy as np
+
+    rows = []
+    for path_index, path in enumerate(paths):
+        cumulative = 0.0
+        for segment in path:
+            row, kind = segment_to_row(segment)
+            cumulative += segment.length()
+            row.extend((kind, path_index, cumulative))
+            row.extend(segment.bbox())
+            rows.append(row)
+    return np.array(rows, dtype=dtype).reshape(-1, COMPACT_COLUMNS)
+
+
+def save_compact_paths(filename, geometry):
+    import numpy as np
+
+    np.save(filename, np.ascontiguousarray(geometry))
+
+
+def load_compact_paths(filename, mmap=True):
+    import numpy as np
+
+    return np.load(filename, mmap_mode="r" if mmap else None)
+
+
+def split_compact_paths(geometry):
+    import numpy as np
+
+    boundaries = np.flatnonzero(np.diff(geometry[:, PATH_INDEX])) + 1
+    return np.split(geometry, boundaries)
+
+
+def segment_points(segment, t_values):
+    import numpy as np
+
+    t = np.asarray(t_values, dtype=np.float64)
+    g = segment[CONTROL_POINTS].astype(np.float64)
+
+    if segment[SEGMENT_KIND] == SEGMENT_ARC:
+        # Same evaluation as svgpathtools' Arc.point
+        cx, cy, rx, ry, rotation, theta, delta = g[:7]
+        angle = np.radians(theta + t * delta)
+        cosphi, sinphi = np.cos(np.radians(rotation)), np.sin(np.radians(rotation))
+        x = rx * cosphi * np.cos(angle) - ry * sinphi * np.sin(angle) + cx
+        y = rx * sinphi * np.cos(angle) + ry * cosphi * np.sin(angle) + cy
+        return x + 1j * y
+
+    p = g[0::2] + 1j * g[1::2]
+    mt = 1 - t
+    return mt**3 * p[0] + 3 * mt**2 * t * p[1] + 3 * mt * t**2 * p[2] + t**3 * p[3]
+
+
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip("#")
     return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
@@ -53,6 +252,29 @@ def get_rainbow_color(progress):
     return tuple(int(x * 255) for x in rgb)
 
 
+# Taper widths and rainbow colors only depend on position along the stroke
+# (0-1) and overall progress (0-1), so they are tabulated once per animation
+# and indexed by the renderer instead of being recomputed for every point.
+# Tables are cached, so callers that don't pass them in still build them once.
+LOOKUP_TABLE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def build_width_table(base_width, max_width, size=LOOKUP_TABLE_SIZE):
+    import numpy as np
+
+    table = np.array(
+        [get_variable_width(i / (size - 1), base_width, max_width) for i in range(size)]
+    )
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def build_rainbow_table(size=LOOKUP_TABLE_SIZE):
+    return tuple(get_rainbow_color(i / size) for i in range(size))
+
+
 def create_frame(
     paths,
     progress,
@@ -64,14 +286,22 @@ def create_frame(
     padding,
     is_loopback,
     use_rainbow_mode,
+    width_table=None,
+    rainbow_table=None,
 ):
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    if not all(isinstance(path, np.ndarray) for path in paths):
+        paths = split_compact_paths(compact_paths(paths))
+
     img = Image.new("RGBA", (width, height), color=(255, 255, 255, 0))
     draw = ImageDraw.Draw(img)
 
-    xmin = min(path.bbox()[0] for path in paths)
-    xmax = max(path.bbox()[1] for path in paths)
-    ymin = min(path.bbox()[2] for path in paths)
-    ymax = max(path.bbox()[3] for path in paths)
+    xmin = min(path[:, BBOX][:, 0].min() for path in paths)
+    xmax = max(path[:, BBOX][:, 1].max() for path in paths)
+    ymin = min(path[:, BBOX][:, 2].min() for path in paths)
+    ymax = max(path[:, BBOX][:, 3].max() for path in paths)
 
     content_width = xmax - xmin
     content_height = ymax - ymin
@@ -87,11 +317,11 @@ def create_frame(
         padding + (height - 2 * padding - content_height * scale) / 2 - ymin * scale
     )
 
-    total_length = sum(path.length() for path in paths)
+    total_length = sum(path[-1, CUMULATIVE_LENGTH] for path in paths)
     current_length = 0
 
     for path in paths:
-        path_length = path.length()
+        path_length = path[-1, CUMULATIVE_LENGTH]
         path_start_progress = current_length / total_length
         path_end_progress = (current_length + path_length) / total_length
 
@@ -99,17 +329,13 @@ def create_frame(
             continue
         elif progress >= path_end_progress:
             # Draw the entire path
-            if use_rainbow_mode:
-                path_color = get_rainbow_color(path_start_progress)
-            else:
-                path_color = color
             draw_path(
                 draw,
                 path,
                 scale,
                 offset_x,
                 offset_y,
-                path_color,
+                color,
                 base_stroke_width,
                 use_variable_width,
                 0,
@@ -118,26 +344,21 @@ def create_frame(
                 use_rainbow_mode,
                 path_start_progress,
                 path_end_progress,
+                width_table,
+                rainbow_table,
             )
         else:
             # Draw partial path
             path_progress = (progress - path_start_progress) / (
                 path_end_progress - path_start_progress
             )
-            if use_rainbow_mode:
-                path_color = get_rainbow_color(
-                    path_start_progress
-                    + path_progress * (path_end_progress - path_start_progress)
-                )
-            else:
-                path_color = color
             draw_path(
                 draw,
                 path,
                 scale,
                 offset_x,
                 offset_y,
-                path_color,
+                color,
                 base_stroke_width,
                 use_variable_width,
                 0,
@@ -146,6 +367,8 @@ def create_frame(
                 use_rainbow_mode,
                 path_start_progress,
                 path_end_progress,
+                width_table,
+                rainbow_table,
             )
             break
 
@@ -169,8 +392,19 @@ def draw_path(
     use_rainbow_mode,
     path_start_progress,
     path_end_progress,
+    width_table=None,
+    rainbow_table=None,
 ):
-    cumulative_length = np.cumsum([seg.length() for seg in path])
+    import numpy as np
+
+    if not isinstance(path, np.ndarray):
+        path = compact_paths([path])
+    if use_variable_width and width_table is None:
+        width_table = build_width_table(base_stroke_width, base_stroke_width * 2)
+    if use_rainbow_mode and rainbow_table is None:
+        rainbow_table = build_rainbow_table()
+
+    cumulative_length = path[:, CUMULATIVE_LENGTH]
     total_path_length = cumulative_length[-1]
 
     points = []
@@ -178,6 +412,7 @@ def draw_path(
     colors = []
 
     for i, segment in enumerate(path):
+        seg_length = cumulative_length[i] - (cumulative_length[i - 1] if i > 0 else 0)
         seg_start = cumulative_length[i - 1] / total_path_length if i > 0 else 0
         seg_end = cumulative_length[i] / total_path_length
 
@@ -192,35 +427,32 @@ def draw_path(
         if is_loopback:
             t_end = min(t_end, 0.4)
 
-        num_points = max(50, int(500 * segment.length() / total_path_length))
+        num_points = max(50, int(500 * seg_length / total_path_length))
         t_values = np.linspace(t_start, t_end, num_points)
-        seg_points = [segment.point(t) for t in t_values]
+        seg_points = segment_points(segment, t_values)
         points.extend(seg_points)
 
+        global_t_values = np.linspace(
+            seg_start + t_start * (seg_end - seg_start),
+            seg_start + t_end * (seg_end - seg_start),
+            num_points,
+        )
+
         if use_variable_width:
-            global_t_values = np.linspace(
-                seg_start + t_start * (seg_end - seg_start),
-                seg_start + t_end * (seg_end - seg_start),
-                num_points,
-            )
-            seg_widths = [
-                get_variable_width(t, base_stroke_width, base_stroke_width * 2)
-                for t in global_t_values
-            ]
-            widths.extend(seg_widths)
+            size = len(width_table)
+            indices = np.rint(global_t_values * (size - 1)).astype(int)
+            widths.extend(width_table[np.clip(indices, 0, size - 1)].tolist())
         else:
             widths.extend([base_stroke_width] * num_points)
 
         if use_rainbow_mode:
-            seg_colors = [
-                get_rainbow_color(
-                    path_start_progress
-                    + (path_end_progress - path_start_progress)
-                    * (seg_start + t * (seg_end - seg_start))
-                )
-                for t in t_values
-            ]
-            colors.extend(seg_colors)
+            size = len(rainbow_table)
+            progress_values = (
+                path_start_progress
+                + (path_end_progress - path_start_progress) * global_t_values
+            )
+            indices = np.rint(progress_values * size).astype(int) % size
+            colors.extend(rainbow_table[j] for j in indices.tolist())
 
     for i in range(len(points) - 1):
         p1 = points[i]
@@ -255,6 +487,19 @@ def create_animation(
     is_loopback,
     use_rainbow_mode,
 ):
+    import numpy as np
+
+    if not isinstance(paths, np.ndarray):
+        paths = compact_paths(paths)
+    paths = split_compact_paths(paths)
+
+    width_table = (
+        build_width_table(base_stroke_width, base_stroke_width * 2)
+        if use_variable_width
+        else None
+    )
+    rainbow_table = build_rainbow_table() if use_rainbow_mode else None
+
     total_frames = int((duration + linger_time) * fps)
     animation_frames = int(duration * fps)
     linger_frames = total_frames - animation_frames
@@ -274,6 +519,8 @@ def create_animation(
             padding,
             is_loopback,
             use_rainbow_mode,
+            width_table,
+            rainbow_table,
         )
         frames.append(frame)
 
@@ -288,10 +535,46 @@ def get_user_input(prompt, default):
     return user_input if user_input else default
 
 
+def input_file_error(svg_file):
+    if not os.path.exists(svg_file):
+        return f"File not found: {svg_file}"
+    if not os.path.isfile(svg_file):
+        return f"Not a file: {svg_file}"
+    return None
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Animate SVG handwriting as a GIF")
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "--validate",
+        metavar="SVG_FILE",
+        help="check an SVG's dimensions, path count and path data syntax "
+        "without rendering",
+    )
+    args = parser.parse_args()
+
+    if args.validate:
+        error = input_file_error(args.validate)
+        if error:
+            print(error)
+            sys.exit(1)
+        path_count, width, height, errors = validate_svg(args.validate)
+        if path_count is not None:
+            print(f"{args.validate}: {width}x{height}, {path_count} paths")
+        for error in errors:
+            print(f"Error: {error}")
+        sys.exit(1 if errors else 0)
+
     print("--- Handwriting Animator 2024 ---")
 
     svg_file = get_user_input("Enter the name of your SVG file", "input.svg")
+    error = input_file_error(svg_file)
+    if error:
+        print(error)
+        sys.exit(1)
     output_file = os.path.splitext(svg_file)[0] + ".gif"
     is_loopback = (
         get_user_input(